@@ -20,31 +20,93 @@ async function initTauri() {
 }
 
 // ---------- Field Specifications ----------
+// shift is the field's bit offset within the 16-bit word (MSB-byte fields start at 8)
 const FIELD_SPECS = [
   // Fields valid for both REG and MTP (reg_addr = mtp_addr + 0x20)
-  { name: "RG_X", regAddr: 0x20, mtpAddr: 0x00, byteSel: "LSB", lsb: 0, width: 3 },
-  { name: "FG_X", regAddr: 0x20, mtpAddr: 0x00, byteSel: "LSB", lsb: 3, width: 5 },
-  { name: "RG_Y", regAddr: 0x22, mtpAddr: 0x02, byteSel: "LSB", lsb: 0, width: 3 },
-  { name: "FG_Y", regAddr: 0x22, mtpAddr: 0x02, byteSel: "LSB", lsb: 3, width: 5 },
-  { name: "RG_Z", regAddr: 0x24, mtpAddr: 0x04, byteSel: "LSB", lsb: 0, width: 3 },
-  { name: "FG_Z", regAddr: 0x24, mtpAddr: 0x04, byteSel: "LSB", lsb: 3, width: 5 },
-  { name: "VOQ_OUT1", regAddr: 0x20, mtpAddr: 0x00, byteSel: "MSB", lsb: 0, width: 4 },
-  { name: "VOQ_OUT2", regAddr: 0x22, mtpAddr: 0x02, byteSel: "MSB", lsb: 0, width: 4 },
-  { name: "AXIS_CH1", regAddr: 0x26, mtpAddr: 0x06, byteSel: "LSB", lsb: 0, width: 2 },
-  { name: "AXIS_CH2", regAddr: 0x26, mtpAddr: 0x06, byteSel: "LSB", lsb: 2, width: 2 },
-  { name: "PLATEZ", regAddr: 0x26, mtpAddr: 0x06, byteSel: "LSB", lsb: 4, width: 2 },
-  { name: "TC", regAddr: 0x28, mtpAddr: 0x08, byteSel: "LSB", lsb: 0, width: 5 },
-  { name: "FILT", regAddr: 0x2A, mtpAddr: 0x0A, byteSel: "LSB", lsb: 0, width: 5 },
+  { name: "RG_X", regAddr: 0x20, mtpAddr: 0x00, shift: 0, width: 3 },
+  { name: "FG_X", regAddr: 0x20, mtpAddr: 0x00, shift: 3, width: 5 },
+  { name: "RG_Y", regAddr: 0x22, mtpAddr: 0x02, shift: 0, width: 3 },
+  { name: "FG_Y", regAddr: 0x22, mtpAddr: 0x02, shift: 3, width: 5 },
+  { name: "RG_Z", regAddr: 0x24, mtpAddr: 0x04, shift: 0, width: 3 },
+  { name: "FG_Z", regAddr: 0x24, mtpAddr: 0x04, shift: 3, width: 5 },
+  { name: "VOQ_OUT1", regAddr: 0x20, mtpAddr: 0x00, shift: 8, width: 4 },
+  { name: "VOQ_OUT2", regAddr: 0x22, mtpAddr: 0x02, shift: 8, width: 4 },
+  { name: "AXIS_CH1", regAddr: 0x26, mtpAddr: 0x06, shift: 0, width: 2 },
+  { name: "AXIS_CH2", regAddr: 0x26, mtpAddr: 0x06, shift: 2, width: 2 },
+  { name: "PLATEZ", regAddr: 0x26, mtpAddr: 0x06, shift: 4, width: 2 },
+  { name: "TC", regAddr: 0x28, mtpAddr: 0x08, shift: 0, width: 5 },
+  { name: "FILT", regAddr: 0x2A, mtpAddr: 0x0A, shift: 0, width: 5 },
   // Fields valid for MTP only (regAddr = null)
-  { name: "DIS_DIAG", regAddr: null, mtpAddr: 0x0C, byteSel: "LSB", lsb: 1, width: 1 },
-  { name: "MEMLOCK", regAddr: null, mtpAddr: 0x0C, byteSel: "LSB", lsb: 0, width: 1 },
-  { name: "TC350_DATA", regAddr: null, mtpAddr: 0x0E, byteSel: "LSB", lsb: 0, width: 4 },
-  { name: "TC2000_DATA", regAddr: null, mtpAddr: 0x14, byteSel: "MSB", lsb: 4, width: 4 },
-  { name: "CHIP_ID1", regAddr: null, mtpAddr: 0x1A, byteSel: "LSB", lsb: 0, width: 8 },
-  { name: "CHIP_ID2", regAddr: null, mtpAddr: 0x1C, byteSel: "LSB", lsb: 0, width: 8 },
-  { name: "CHIP_ID3", regAddr: null, mtpAddr: 0x1E, byteSel: "LSB", lsb: 0, width: 8 },
+  { name: "DIS_DIAG", regAddr: null, mtpAddr: 0x0C, shift: 1, width: 1 },
+  { name: "MEMLOCK", regAddr: null, mtpAddr: 0x0C, shift: 0, width: 1 },
+  { name: "TC350_DATA", regAddr: null, mtpAddr: 0x0E, shift: 0, width: 4 },
+  { name: "TC2000_DATA", regAddr: null, mtpAddr: 0x14, shift: 12, width: 4 },
+  { name: "CHIP_ID1", regAddr: null, mtpAddr: 0x1A, shift: 0, width: 8 },
+  { name: "CHIP_ID2", regAddr: null, mtpAddr: 0x1C, shift: 0, width: 8 },
+  { name: "CHIP_ID3", regAddr: null, mtpAddr: 0x1E, shift: 0, width: 8 },
 ];
 
+// Register words live at 0x20..0x2E and MTP words at 0x00..0x1E, two bytes apart
+const REG_BASE = 0x20;
+const REG_WORD_COUNT = 8;
+const MTP_WORD_COUNT = 16;
+
+function regIndex(addr) {
+  return (addr - REG_BASE) >> 1;
+}
+
+function mtpIndex(addr) {
+  return addr >> 1;
+}
+
+// Precompute the field mask and word indexes once so get/set are plain bit ops.
+// regIdx is -1 for fields with no register address.
+FIELD_SPECS.forEach(spec => {
+  spec.mask = (1 << spec.width) - 1;
+  spec.regIdx = spec.regAddr === null ? -1 : regIndex(spec.regAddr);
+  spec.mtpIdx = mtpIndex(spec.mtpAddr);
+  Object.freeze(spec);
+});
+
+// Per-field decode tables for batch decoding the word arrays
+const REG_FIELD_IDX = Int8Array.from(FIELD_SPECS, s => s.regIdx);
+const MTP_FIELD_IDX = Int8Array.from(FIELD_SPECS, s => s.mtpIdx);
+const FIELD_SHIFT = Uint8Array.from(FIELD_SPECS, s => s.shift);
+const FIELD_MASK = Uint16Array.from(FIELD_SPECS, s => s.mask);
+
+// Rows grouped by packed word index, so each word is loaded once and all of
+// its fields are extracted from that one value
+function groupRowsByWord(addrIdx, nWords) {
+  const groups = Array.from({ length: nWords }, () => []);
+  addrIdx.forEach((k, row) => {
+    if (k >= 0) groups[k].push(row);
+  });
+  return groups.map(rows => Uint8Array.from(rows));
+}
+
+const REG_WORD_ROWS = groupRowsByWord(REG_FIELD_IDX, REG_WORD_COUNT);
+const MTP_WORD_ROWS = groupRowsByWord(MTP_FIELD_IDX, MTP_WORD_COUNT);
+
+// Word address -> decoded-table rows that read it (reg and MTP addresses never overlap)
+const FIELD_ROWS = FIELD_SPECS.map((_, idx) => idx);
+const ADDR_FIELD_ROWS = new Map();
+FIELD_SPECS.forEach((spec, idx) => {
+  for (const addr of [spec.regAddr, spec.mtpAddr]) {
+    if (addr === null) continue;
+    if (!ADDR_FIELD_ROWS.has(addr)) ADDR_FIELD_ROWS.set(addr, []);
+    ADDR_FIELD_ROWS.get(addr).push(idx);
+  }
+});
+
+function fieldRowsFor(addrs) {
+  const rows = new Set();
+  for (const addr of addrs) {
+    const r = ADDR_FIELD_ROWS.get(addr);
+    if (r) r.forEach(idx => rows.add(idx));
+  }
+  return rows;
+}
+
 // Sensing mode presets: {mode: [AXIS_CH1, AXIS_CH2, PLATEZ]}
 const SENSING_MODES = {
   xy: [0, 1, 0], // X/Y mode
@@ -55,13 +117,42 @@ const SENSING_MODES = {
   zy: [2, 1, 1], // Z/Y mode
 };
 
+// Field specs written by a sensing mode preset, in preset order
+const SENSING_MODE_SPECS = ["AXIS_CH1", "AXIS_CH2", "PLATEZ"].map(
+  name => FIELD_SPECS.find(spec => spec.name === name)
+);
+
+// All three fields share register word 0x26, so each preset reduces to one
+// masked write of that word: {mode: [mask, bits]}
+const SENSING_MODE_WORD_IDX = SENSING_MODE_SPECS[0].regIdx;
+const SENSING_MODE_BITS = Object.fromEntries(
+  Object.entries(SENSING_MODES).map(([mode, preset]) => {
+    let mask = 0;
+    let bits = 0;
+    preset.forEach((value, i) => {
+      const { shift, mask: fieldMask } = SENSING_MODE_SPECS[i];
+      mask |= fieldMask << shift;
+      bits |= (value & fieldMask) << shift;
+    });
+    return [mode, [mask, bits]];
+  })
+);
+
 // ---------- State ----------
-let regWords = {}; // addr -> word (0x20..0x2E)
-let mtpWords = {}; // addr -> word (0x00..0x1E)
+const regWords = new Uint16Array(REG_WORD_COUNT); // regIndex(addr) -> word
+const mtpWords = new Uint16Array(MTP_WORD_COUNT); // mtpIndex(addr) -> word
 let connected = false;
 let regRead = false;
 let mtpRead = false;
-let pollInterval = null;
+let polling = false;
+let pollTimer = null; // pending poll, null while a read is in flight or idle
+
+// Scratch buffers reused by refreshTables()
+const regFieldVals = new Uint16Array(FIELD_SPECS.length);
+const mtpFieldVals = new Uint16Array(FIELD_SPECS.length);
+// Field values as last displayed, to skip rows whose decoded value is unchanged
+const shownRegFieldVals = new Uint16Array(FIELD_SPECS.length);
+const shownMtpFieldVals = new Uint16Array(FIELD_SPECS.length);
 
 // ---------- DOM Elements ----------
 const portSelect = document.getElementById("port-select");
@@ -81,61 +172,75 @@ const btnCopyRegMtp = document.getElementById("btn-copy-reg-mtp");
 
 const actionButtons = [btnIdentify, btnReadReg, btnReadMtp, btnMeasure, btnProgReg, btnProgMtp, btnCopyRegMtp];
 
+// Table cells, looked up once when the tables are built
+const regCells = {}; // addr -> {dec, hex}
+const mtpCells = {}; // addr -> {dec, hex}
+const decodedCells = []; // field idx -> {regInput, mtpInput, regHex, mtpHex}
+
 // ---------- Utility Functions ----------
-function getByte(word, byteSel) {
-  word &= 0xFFFF;
-  return byteSel === "LSB" ? (word & 0xFF) : ((word >> 8) & 0xFF);
-}
-
-function setByte(word, byteSel, byteVal) {
-  word &= 0xFFFF;
-  byteVal &= 0xFF;
-  return byteSel === "LSB" 
-    ? (word & 0xFF00) | byteVal 
-    : (word & 0x00FF) | (byteVal << 8);
-}
-
-function getFieldAt(words, addr, spec) {
-  if (addr === null) return null;
-  const w = (words[addr] || 0) & 0xFFFF;
-  const b = getByte(w, spec.byteSel);
-  const mask = (1 << spec.width) - 1;
-  return (b >> spec.lsb) & mask;
-}
-
-function setFieldAt(words, addr, spec, value) {
-  if (addr === null) return false;
-  const mask = (1 << spec.width) - 1;
-  const v = value & mask;
-  const w = (words[addr] || 0) & 0xFFFF;
-  let b = getByte(w, spec.byteSel);
-  b = (b & ~(mask << spec.lsb)) | (v << spec.lsb);
-  words[addr] = setByte(w, spec.byteSel, b) & 0xFFFF;
+function getFieldAt(words, idx, spec) {
+  if (idx < 0) return null;
+  return (words[idx] >> spec.shift) & spec.mask;
+}
+
+function setFieldAt(words, idx, spec, value) {
+  if (idx < 0) return false;
+  words[idx] = (words[idx] & ~(spec.mask << spec.shift)) | ((value & spec.mask) << spec.shift);
   return true;
 }
 
+function decodeFields(words, wordRows, out) {
+  for (let k = 0; k < wordRows.length; k++) {
+    const rows = wordRows[k];
+    if (rows.length === 0) continue;
+    const w = words[k];
+    for (let j = 0; j < rows.length; j++) {
+      const row = rows[j];
+      out[row] = (w >> FIELD_SHIFT[row]) & FIELD_MASK[row];
+    }
+  }
+}
+
 function getRegField(spec) {
-  return getFieldAt(regWords, spec.regAddr, spec);
+  return getFieldAt(regWords, spec.regIdx, spec);
 }
 
 function getMtpField(spec) {
-  return getFieldAt(mtpWords, spec.mtpAddr, spec);
+  return getFieldAt(mtpWords, spec.mtpIdx, spec);
 }
 
 function setRegField(spec, value) {
-  return setFieldAt(regWords, spec.regAddr, spec, value);
+  return setFieldAt(regWords, spec.regIdx, spec, value);
 }
 
 function setMtpField(spec, value) {
-  return setFieldAt(mtpWords, spec.mtpAddr, spec, value);
+  return setFieldAt(mtpWords, spec.mtpIdx, spec, value);
 }
 
 // ---------- Logging ----------
+// Lines are queued and appended once per animation frame, so a burst of
+// serial traffic costs one DOM append and one scroll instead of one per line.
+const pendingLog = [];
+let logQueued = false;
+
 function log(msg, type = "info") {
-  const line = document.createElement("div");
-  line.className = type;
-  line.textContent = msg;
-  logEl.appendChild(line);
+  pendingLog.push([msg, type]);
+  if (logQueued) return;
+  logQueued = true;
+  requestAnimationFrame(flushLog);
+}
+
+function flushLog() {
+  const frag = document.createDocumentFragment();
+  for (const [msg, type] of pendingLog) {
+    const line = document.createElement("div");
+    line.className = type;
+    line.textContent = msg;
+    frag.appendChild(line);
+  }
+  pendingLog.length = 0;
+  logQueued = false;
+  logEl.appendChild(frag);
   logEl.scrollTop = logEl.scrollHeight;
 }
 
@@ -170,7 +275,10 @@ function initRegTable() {
       <td class="hex" id="reg-hex-${addr}">0x0000</td>
     `;
     tbody.appendChild(tr);
-    regWords[addr] = 0;
+    regCells[addr] = {
+      dec: document.getElementById(`reg-dec-${addr}`),
+      hex: document.getElementById(`reg-hex-${addr}`),
+    };
   }
 }
 
@@ -185,7 +293,10 @@ function initMtpTable() {
       <td class="hex" id="mtp-hex-${addr}">0x0000</td>
     `;
     tbody.appendChild(tr);
-    mtpWords[addr] = 0;
+    mtpCells[addr] = {
+      dec: document.getElementById(`mtp-dec-${addr}`),
+      hex: document.getElementById(`mtp-hex-${addr}`),
+    };
   }
 }
 
@@ -202,33 +313,41 @@ function initDecodedTable() {
       <td>${spec.name}</td>
       <td class="${regEditable ? "editable" : "na"}">
         ${regEditable 
-          ? `<input type="number" id="dec-reg-${idx}" value="0" min="0" max="${(1 << spec.width) - 1}">`
+          ? `<input type="number" id="dec-reg-${idx}" value="0" min="0" max="${spec.mask}">`
           : "N/A"}
       </td>
       <td class="${mtpEditable ? "editable" : ""}">
-        <input type="number" id="dec-mtp-${idx}" value="0" min="0" max="${(1 << spec.width) - 1}" ${mtpEditable ? "" : "disabled"}>
+        <input type="number" id="dec-mtp-${idx}" value="0" min="0" max="${spec.mask}" ${mtpEditable ? "" : "disabled"}>
       </td>
       <td class="hex" id="dec-reg-hex-${idx}">${regEditable ? "0x0" : "N/A"}</td>
       <td class="hex" id="dec-mtp-hex-${idx}">0x0</td>
     `;
     tbody.appendChild(tr);
     
+    const cells = {
+      regInput: document.getElementById(`dec-reg-${idx}`),
+      mtpInput: document.getElementById(`dec-mtp-${idx}`),
+      regHex: document.getElementById(`dec-reg-hex-${idx}`),
+      mtpHex: document.getElementById(`dec-mtp-hex-${idx}`),
+    };
+    decodedCells[idx] = cells;
+    
     // Event listeners for editable fields
     if (regEditable) {
-      const regInput = document.getElementById(`dec-reg-${idx}`);
+      const regInput = cells.regInput;
       regInput.addEventListener("change", () => {
         let v = parseInt(regInput.value) || 0;
-        v &= (1 << spec.width) - 1;
+        v &= spec.mask;
         setRegField(spec, v);
         refreshTables();
       });
     }
     
     if (mtpEditable) {
-      const mtpInput = document.getElementById(`dec-mtp-${idx}`);
+      const mtpInput = cells.mtpInput;
       mtpInput.addEventListener("change", () => {
         let v = parseInt(mtpInput.value) || 0;
-        v &= (1 << spec.width) - 1;
+        v &= spec.mask;
         setMtpField(spec, v);
         refreshTables();
       });
@@ -237,45 +356,102 @@ function initDecodedTable() {
 }
 
 // ---------- Table Refresh ----------
-function refreshTables() {
-  // Register table
-  for (let addr = 0x20; addr <= 0x2E; addr += 2) {
-    const w = regWords[addr] || 0;
-    document.getElementById(`reg-dec-${addr}`).textContent = w;
-    document.getElementById(`reg-hex-${addr}`).textContent = `0x${w.toString(16).toUpperCase().padStart(4, "0")}`;
-  }
-  
-  // MTP table
-  for (let addr = 0x00; addr <= 0x1E; addr += 2) {
-    const w = mtpWords[addr] || 0;
-    document.getElementById(`mtp-dec-${addr}`).textContent = w;
-    document.getElementById(`mtp-hex-${addr}`).textContent = `0x${w.toString(16).toUpperCase().padStart(4, "0")}`;
+// Hex strings for every 16-bit word ("0x0000") and every field value ("0x0"),
+// so refreshes index a table instead of formatting
+const HEX_WORD = Array.from({ length: 0x10000 }, (_, v) => `0x${v.toString(16).toUpperCase().padStart(4, "0")}`);
+const HEX_FIELD = Array.from({ length: 0x100 }, (_, v) => `0x${v.toString(16).toUpperCase()}`);
+
+// Last text written to each cell, so unchanged cells are not touched
+const cellText = new Map();
+
+function setCellText(el, text) {
+  if (cellText.get(el) === text) return;
+  el.textContent = text;
+  cellText.set(el, text);
+}
+
+function setInputValue(el, value) {
+  // Compare against the live value: the user may have typed over it
+  const text = String(value);
+  if (el.value !== text) el.value = text;
+}
+
+// `changed` is an optional Set of word addresses; when given, only rows that
+// depend on those addresses are rewritten.
+function refreshWordTable(words, cells, baseAddr, changed) {
+  for (let i = 0; i < words.length; i++) {
+    const addr = baseAddr + 2 * i;
+    if (changed && !changed.has(addr)) continue;
+    const w = words[i];
+    const { dec, hex } = cells[addr];
+    setCellText(dec, String(w));
+    setCellText(hex, HEX_WORD[w]);
   }
+}
+
+function refreshTables(changed = null) {
+  refreshWordTable(regWords, regCells, REG_BASE, changed);
+  refreshWordTable(mtpWords, mtpCells, 0x00, changed);
   
-  // Decoded table
-  FIELD_SPECS.forEach((spec, idx) => {
-    const rv = getRegField(spec);
-    const mv = getMtpField(spec);
-    
-    const regInput = document.getElementById(`dec-reg-${idx}`);
-    const mtpInput = document.getElementById(`dec-mtp-${idx}`);
-    const regHex = document.getElementById(`dec-reg-hex-${idx}`);
-    const mtpHex = document.getElementById(`dec-mtp-hex-${idx}`);
-    
-    if (regInput && rv !== null) {
-      regInput.value = rv;
-      regHex.textContent = `0x${rv.toString(16).toUpperCase()}`;
+  // Decoded table: decode every field in one pass over the word arrays
+  decodeFields(regWords, REG_WORD_ROWS, regFieldVals);
+  decodeFields(mtpWords, MTP_WORD_ROWS, mtpFieldVals);
+
+  const rows = changed ? fieldRowsFor(changed) : FIELD_ROWS;
+  for (const idx of rows) {
+    const { regInput, mtpInput, regHex, mtpHex } = decodedCells[idx];
+
+    // Incremental refreshes only format fields whose value actually changed;
+    // a full refresh rewrites everything to reset any user-typed input
+    const rv = regFieldVals[idx];
+    if (regInput && REG_FIELD_IDX[idx] >= 0 && (!changed || rv !== shownRegFieldVals[idx])) {
+      setInputValue(regInput, rv);
+      setCellText(regHex, HEX_FIELD[rv]);
     }
     
-    if (mtpInput) {
-      mtpInput.value = mv;
-      mtpHex.textContent = `0x${mv.toString(16).toUpperCase()}`;
+    const mv = mtpFieldVals[idx];
+    if (mtpInput && (!changed || mv !== shownMtpFieldVals[idx])) {
+      setInputValue(mtpInput, mv);
+      setCellText(mtpHex, HEX_FIELD[mv]);
     }
+  }
+  shownRegFieldVals.set(regFieldVals);
+  shownMtpFieldVals.set(mtpFieldVals);
+}
+
+// Coalesce incoming-data refreshes within one frame into a single table update
+let refreshQueued = false;
+let pendingAddrs = new Set();
+
+function scheduleRefresh(changed) {
+  changed.forEach(addr => pendingAddrs.add(addr));
+  if (refreshQueued) return;
+  refreshQueued = true;
+  requestAnimationFrame(() => {
+    const addrs = pendingAddrs;
+    refreshQueued = false;
+    pendingAddrs = new Set();
+    refreshTables(addrs);
   });
 }
 
 // ---------- Serial Communication ----------
-async function refreshPorts() {
+// Repeated Refresh clicks share a running scan and reuse a very recent result
+const PORT_SCAN_CACHE_MS = 500;
+let portScan = null;
+let lastPortScanAt = 0;
+
+function refreshPorts() {
+  if (portScan) return portScan;
+  if (Date.now() - lastPortScanAt < PORT_SCAN_CACHE_MS) return Promise.resolve();
+  portScan = scanPorts().finally(() => {
+    portScan = null;
+    lastPortScanAt = Date.now();
+  });
+  return portScan;
+}
+
+async function scanPorts() {
   if (!invoke) {
     log("Cannot refresh ports: Tauri API not available", "error");
     return;
@@ -354,15 +530,27 @@ async function sendCommand(cmd) {
 }
 
 // ---------- Polling for incoming data ----------
+// Each poll is scheduled only after the previous read completes, so reads never
+// pile up behind a slow invoke and nothing runs while disconnected.
+const POLL_MS = 20;
+
 function startPolling() {
-  if (pollInterval) return;
-  pollInterval = setInterval(pollIncoming, 20);  // Poll every 20ms for faster response
+  if (polling) return;
+  polling = true;
+  pollTimer = setTimeout(pollLoop, 0);
 }
 
 function stopPolling() {
-  if (pollInterval) {
-    clearInterval(pollInterval);
-    pollInterval = null;
+  polling = false;
+  clearTimeout(pollTimer);
+  pollTimer = null;
+}
+
+async function pollLoop() {
+  pollTimer = null;
+  await pollIncoming();
+  if (polling && pollTimer === null) {
+    pollTimer = setTimeout(pollLoop, POLL_MS);
   }
 }
 
@@ -370,53 +558,97 @@ async function pollIncoming() {
   if (!connected) return;
   try {
     const result = await invoke("read_incoming");
+    const changed = new Set();
     for (const line of result.lines) {
       log(`<< ${line}`, "rx");
-      parseLine(line);
+      parseLine(line, changed);
     }
+    // One refresh per batch of lines, limited to the words that were received
+    if (changed.size > 0) scheduleRefresh(changed);
   } catch (e) {
     // Ignore read timeouts
   }
 }
 
 // ---------- Line Parsing ----------
-function parseLine(line) {
+const HEX_PAIR_RE = /([0-9A-Fa-f]+)\s+([0-9A-Fa-f]+)/g;
+const MEAS_RE = /OUT1\s+(\d+)\s+OUT2\s+(\d+)/i;
+
+function isHexToken(tok) {
+  const n = tok.length;
+  if (n === 0 || n > 4) return false;
+  for (let i = 0; i < n; i++) {
+    const c = tok.charCodeAt(i);
+    const isDigit = c >= 0x30 && c <= 0x39;     // 0-9
+    const isUpper = c >= 0x41 && c <= 0x46;     // A-F
+    const isLower = c >= 0x61 && c <= 0x66;     // a-f
+    if (!isDigit && !isUpper && !isLower) return false;
+  }
+  return true;
+}
+
+// Firmware dumps are "addr word addr word ... " separated by single spaces,
+// so a plain split is enough; anything else falls back to the regex scan.
+function parseHexPairs(line) {
+  const toks = line.trim().split(" ");
+  const pairs = [];
+  if (toks.length % 2 === 0) {
+    for (let i = 0; i < toks.length; i += 2) {
+      if (!isHexToken(toks[i]) || !isHexToken(toks[i + 1])) {
+        pairs.length = 0;
+        break;
+      }
+      pairs.push([parseInt(toks[i], 16), parseInt(toks[i + 1], 16)]);
+    }
+    if (pairs.length > 0) return pairs;
+  }
+
+  // Fallback for malformed lines
+  for (const m of line.matchAll(HEX_PAIR_RE)) {
+    pairs.push([parseInt(m[1], 16), parseInt(m[2], 16)]);
+  }
+  return pairs;
+}
+
+// Returns true if the line updated regWords/mtpWords; updated addresses are
+// added to `changed` when provided.
+function parseLine(line, changed = null) {
   // Identify response
   if (line.trim() === "90381") {
     log("Firmware ID OK (90381)", "info");
-    return;
+    return false;
   }
   
   // Measurement response: OUT1 1234 OUT2 5678
-  const measMatch = line.match(/OUT1\s+(\d+)\s+OUT2\s+(\d+)/i);
+  const measMatch = MEAS_RE.exec(line);
   if (measMatch) {
     log(`Measurement: OUT1=${measMatch[1]}, OUT2=${measMatch[2]}`, "info");
-    return;
+    return false;
   }
   
   // Hex pairs: 20 1234 22 5678 ...
-  const hexPairs = [...line.matchAll(/([0-9A-Fa-f]+)\s+([0-9A-Fa-f]+)/g)];
-  if (hexPairs.length > 0) {
-    for (const m of hexPairs) {
-      const addr = parseInt(m[1], 16);
-      const word = parseInt(m[2], 16) & 0xFFFF;
-      if (addr >= 0x20) {
-        regWords[addr] = word;
-      } else {
-        mtpWords[addr] = word;
-      }
+  const hexPairs = parseHexPairs(line);
+  let updated = false;
+  for (const [addr, word] of hexPairs) {
+    // Ignore pairs that do not name a word address (e.g. "ADD 20" prompts)
+    if (addr & 1) continue;
+    if (addr >= REG_BASE) {
+      const i = regIndex(addr);
+      if (i >= REG_WORD_COUNT) continue;
+      regWords[i] = word;
+    } else {
+      mtpWords[mtpIndex(addr)] = word;
     }
-    refreshTables();
+    if (changed) changed.add(addr);
+    updated = true;
   }
+  return updated;
 }
 
 // ---------- Programming ----------
 async function programRegisters() {
   // Collect 8 words from reg table (0x20..0x2E)
-  const words = [];
-  for (let addr = 0x20; addr <= 0x2E; addr += 2) {
-    words.push(regWords[addr] || 0);
-  }
+  const words = Array.from(regWords);
   
   try {
     const result = await invoke("send_memory_sequence", { command: "W", words });
@@ -434,7 +666,7 @@ async function programRegisters() {
 
 async function programMtp() {
   // Check word 6 (0x0C) for MEMLOCK
-  if ((mtpWords[0x0C] || 0) !== 0) {
+  if (mtpWords[mtpIndex(0x0C)] !== 0) {
     const proceed = await showConfirmDialog(
       "Unsafe MTP Content",
       "MTP address 0x0C contains MEMLOCK and diagnostic bits. " +
@@ -453,10 +685,7 @@ async function programMtp() {
   if (!proceed) return;
   
   // Collect first 8 words from MTP table (0x00-0x0E)
-  const words = [];
-  for (let addr = 0x00; addr <= 0x0E; addr += 2) {
-    words.push(mtpWords[addr] || 0);
-  }
+  const words = Array.from(mtpWords.subarray(0, 8));
   
   try {
     const result = await invoke("send_memory_sequence", { command: "E", words });
@@ -517,15 +746,11 @@ function showConfirmDialog(title, message) {
 
 // ---------- Sensing Mode Presets ----------
 function applySensingMode(mode) {
-  const preset = SENSING_MODES[mode];
+  const preset = SENSING_MODE_BITS[mode];
   if (!preset) return;
   
-  const [axisCh1, axisCh2, platez] = preset;
-  FIELD_SPECS.forEach(spec => {
-    if (spec.name === "AXIS_CH1") setRegField(spec, axisCh1);
-    else if (spec.name === "AXIS_CH2") setRegField(spec, axisCh2);
-    else if (spec.name === "PLATEZ") setRegField(spec, platez);
-  });
+  const [mask, bits] = preset;
+  regWords[SENSING_MODE_WORD_IDX] = (regWords[SENSING_MODE_WORD_IDX] & ~mask) | bits;
   
   refreshTables();
   log(`Applied sensing mode: ${mode.toUpperCase()}`, "info");
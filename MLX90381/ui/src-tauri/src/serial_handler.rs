@@ -37,22 +37,35 @@ pub struct ReadResult {
     lines: Vec<String>,
 }
 
+/// Write the whole buffer and wait until it has been transmitted
+fn write_flushed(port: &mut dyn SerialPort, bytes: &[u8]) -> std::io::Result<()> {
+    port.write_all(bytes)?;
+    port.flush()
+}
+
 /// List available serial ports
+///
+/// Port enumeration can block for a while (SetupDi* on Windows), so it runs on
+/// the blocking thread pool rather than an async worker.
 #[tauri::command]
 pub async fn list_ports() -> Vec<PortInfo> {
-    let ports: Vec<SerialPortInfo> = serialport::available_ports().unwrap_or_default();
-    ports
-        .into_iter()
-        .map(|p| PortInfo {
-            description: match &p.port_type {
-                serialport::SerialPortType::UsbPort(info) => {
-                    info.product.clone().unwrap_or_default()
-                }
-                _ => String::new(),
-            },
-            name: p.port_name,
-        })
-        .collect()
+    tauri::async_runtime::spawn_blocking(|| {
+        let ports: Vec<SerialPortInfo> = serialport::available_ports().unwrap_or_default();
+        ports
+            .into_iter()
+            .map(|p| PortInfo {
+                description: match &p.port_type {
+                    serialport::SerialPortType::UsbPort(info) => {
+                        info.product.clone().unwrap_or_default()
+                    }
+                    _ => String::new(),
+                },
+                name: p.port_name,
+            })
+            .collect()
+    })
+    .await
+    .unwrap_or_default()
 }
 
 /// Connect to a serial port
@@ -152,34 +165,36 @@ pub async fn send_memory_sequence(
         });
     }
 
+    // The firmware reads byte-by-byte with no RX buffering and echoes each field,
+    // so the pacing is required. Flush so each delay starts once bytes are sent.
     if let Some(ref mut port) = state.port {
         // Send initial command (W or E)
-        if let Err(e) = port.write(command.as_bytes()) {
+        if let Err(e) = write_flushed(port.as_mut(), command.as_bytes()) {
             return Ok(SerialResult {
                 success: false,
                 message: format!("Failed to send command: {}", e),
             });
         }
-        std::thread::sleep(Duration::from_millis(50));
+        tokio::time::sleep(Duration::from_millis(50)).await;
 
         // Send each word as 5-char decimal + 'y' to accept
         for word in words {
             let field = format!("{:5}", word);
-            if let Err(e) = port.write(field.as_bytes()) {
+            if let Err(e) = write_flushed(port.as_mut(), field.as_bytes()) {
                 return Ok(SerialResult {
                     success: false,
                     message: format!("Failed to send word: {}", e),
                 });
             }
-            std::thread::sleep(Duration::from_millis(10));
+            tokio::time::sleep(Duration::from_millis(10)).await;
 
-            if let Err(e) = port.write(b"y") {
+            if let Err(e) = write_flushed(port.as_mut(), b"y") {
                 return Ok(SerialResult {
                     success: false,
                     message: format!("Failed to send confirm: {}", e),
                 });
             }
-            std::thread::sleep(Duration::from_millis(20));
+            tokio::time::sleep(Duration::from_millis(20)).await;
         }
 
         Ok(SerialResult {
@@ -200,36 +215,43 @@ pub async fn read_incoming(
     state: State<'_, Arc<Mutex<SerialState>>>,
 ) -> Result<ReadResult, String> {
     let mut state = state.lock().await;
+    let SerialState { port, buffer } = &mut *state;
     let mut lines = Vec::new();
 
-    // First, read all available data from port into a temporary buffer
-    let mut incoming = Vec::new();
-    if let Some(ref mut port) = state.port {
-        let mut buf = [0u8; 256];
+    // Read everything the driver has queued straight into the line buffer.
+    // Sizing reads by bytes_to_read() means we never sit in the port timeout
+    // waiting for data that is not there.
+    if let Some(port) = port {
         loop {
-            match port.read(&mut buf) {
-                Ok(n) if n > 0 => {
-                    incoming.extend_from_slice(&buf[..n]);
+            let available = port.bytes_to_read().unwrap_or(0) as usize;
+            if available == 0 {
+                break;
+            }
+            let len = buffer.len();
+            buffer.resize(len + available, 0);
+            match port.read(&mut buffer[len..]) {
+                Ok(n) if n > 0 => buffer.truncate(len + n),
+                _ => {
+                    buffer.truncate(len);
+                    break;
                 }
-                _ => break,
             }
         }
     }
 
-    // Now extend the state buffer (port borrow is released)
-    state.buffer.extend_from_slice(&incoming);
-
-    // Extract complete lines
-    while let Some(pos) = state.buffer.iter().position(|&b| b == b'\n') {
-        let line_bytes: Vec<u8> = state.buffer.drain(..=pos).collect();
-        let mut line = String::from_utf8_lossy(&line_bytes).to_string();
+    // Extract complete lines in a single pass, then drop the consumed prefix once
+    let mut start = 0;
+    while let Some(off) = buffer[start..].iter().position(|&b| b == b'\n') {
+        let end = start + off;
+        let line = String::from_utf8_lossy(&buffer[start..end]);
         // Trim \r\n
-        line = line.trim_end_matches(&['\r', '\n'][..]).to_string();
+        let line = line.trim_end_matches(&['\r', '\n'][..]);
         if !line.is_empty() {
-            lines.push(line);
+            lines.push(line.to_string());
         }
+        start = end + 1;
     }
+    buffer.drain(..start);
 
     Ok(ReadResult { lines })
 }
-
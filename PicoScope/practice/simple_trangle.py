@@ -1,11 +1,20 @@
 import ctypes
+import threading
 import numpy as np
 import matplotlib.pyplot as plt
 from picosdk.ps4000a import ps4000a as ps
-from picosdk.functions import adc2mV, assert_pico_ok
+from picosdk.functions import assert_pico_ok
 from picosdk.constants import PICO_STATUS
 
 
+# Full-scale voltage (mV) per input range index, as used by picosdk's adc2mV
+CH_INPUT_RANGES_MV = [
+   10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000
+]
+# Max ADC value for PS4000A is 32767
+MAX_ADC = 32767
+
+
 # ------------------- 1. CONNECTION (UPDATED FOR 4824) -------------------
 chandle = ctypes.c_int16()
 status = {}
@@ -64,6 +73,10 @@ status["setChA"] = ps.ps4000aSetChannel(
 assert_pico_ok(status["setChA"])
 
 
+# The range is fixed for the session, so the ADC -> mV scale is computed once
+mVPerCount = CH_INPUT_RANGES_MV[chARange] / MAX_ADC
+
+
 # ------------------- 3. SETUP SIGNAL GENERATOR -------------------
 # We want 1kHz, 1Vpp Triangle wave
 # 1Vpp = 1,000,000 uV
@@ -117,6 +130,23 @@ postTriggerSamples = 2500
 maxSamples = preTriggerSamples + postTriggerSamples
 
 
+# Rapid block mode: capture nCaptures blocks back-to-back into separate memory
+# segments and transfer them in one bulk read, instead of a run/transfer
+# round-trip per block. Raise this to record several triggers in one run.
+nCaptures = 1
+maxSegmentSamples = ctypes.c_int32()
+
+
+status["memorySegments"] = ps.ps4000aMemorySegments(
+   chandle, nCaptures, ctypes.byref(maxSegmentSamples)
+)
+assert_pico_ok(status["memorySegments"])
+
+
+status["setNoOfCaptures"] = ps.ps4000aSetNoOfCaptures(chandle, nCaptures)
+assert_pico_ok(status["setNoOfCaptures"])
+
+
 # Use timebase index 402 (1us per sample -> 2.5ms total)
 timebase = 79
 timeIntervalns = ctypes.c_int32()
@@ -135,6 +165,20 @@ assert_pico_ok(status["getTimebase"])
 
 
 # ------------------- 5. CAPTURE DATA -------------------
+# The driver calls blockReady when the capture completes, so we can block on an
+# Event instead of spinning on ps4000aIsReady (which floods USB with queries).
+captureDone = threading.Event()
+
+
+def blockReady(handle, statusCode, pParameter):
+   status["blockReady"] = statusCode
+   captureDone.set()
+
+
+# Keep a reference to the C callback so it is not garbage collected
+cBlockReady = ps.BlockReadyType(blockReady)
+
+
 print("Starting capture...")
 status["runBlock"] = ps.ps4000aRunBlock(
    chandle,
@@ -143,68 +187,128 @@ status["runBlock"] = ps.ps4000aRunBlock(
    timebase,
    None,  # timeIndisposedMs
    0,  # segmentIndex
-   None,  # lpReady
+   cBlockReady,  # lpReady
    None,  # pParameter
 )
 assert_pico_ok(status["runBlock"])
 
 
-# Wait for readiness
-ready = ctypes.c_int16(0)
-check = ctypes.c_int16(0)
-while ready.value == 0:
-   status["isReady"] = ps.ps4000aIsReady(chandle, ctypes.byref(ready))
+# Wait for readiness: the expected capture time plus a margin for USB/driver latency
+captureTimeout_s = nCaptures * maxSamples * timeIntervalns.value * 1e-9 + 2.0
+if not captureDone.wait(timeout=captureTimeout_s):
+   ps.ps4000aStop(chandle)
+   ps.ps4000aCloseUnit(chandle)
+   raise TimeoutError("PicoScope capture did not complete")
+assert_pico_ok(status["blockReady"])
 
 
 # ------------------- 6. RETRIEVE DATA -------------------
-buffer = (ctypes.c_int16 * maxSamples)()
-status["setDataBuffer"] = ps.ps4000aSetDataBuffer(
-   chandle, 0, ctypes.byref(buffer), maxSamples, 0, 0
-)
-assert_pico_ok(status["setDataBuffer"])
+# Set downSampleRatio > 1 to have the scope aggregate every downSampleRatio
+# samples into a min/max pair before the USB transfer, cutting the bytes sent
+# by that ratio while keeping peaks for display.
+downSampleRatio = 1
+if downSampleRatio > 1:
+   ratioMode = ps.PS4000A_RATIO_MODE["PS4000A_RATIO_MODE_AGGREGATE"]
+   nBuffers = 2  # [min, max]
+else:
+   ratioMode = ps.PS4000A_RATIO_MODE["PS4000A_RATIO_MODE_NONE"]
+   nBuffers = 1
+# Round up so a trailing partial bucket still has room in the buffer
+nOutSamples = -(-maxSamples // downSampleRatio)
+
+
+# NumPy owns the capture buffer (segment x [min,] max x samples); the driver
+# writes into it directly, so no zero-filled ctypes array and no later copy.
+buffer = np.empty((nCaptures, nBuffers, nOutSamples), dtype=np.int16)
+# Preallocated mV output so the conversion writes in place
+bufferMV = np.empty(buffer.shape, dtype=np.float32)
+for segment in range(nCaptures):
+   bufferMax = buffer[segment, -1].ctypes.data_as(ctypes.POINTER(ctypes.c_int16))
+   bufferMin = (
+      buffer[segment, 0].ctypes.data_as(ctypes.POINTER(ctypes.c_int16))
+      if nBuffers == 2
+      else None
+   )
+   status["setDataBuffers"] = ps.ps4000aSetDataBuffers(
+      chandle,
+      0,
+      bufferMax,
+      bufferMin,
+      nOutSamples,
+      segment,
+      ratioMode,
+   )
+   assert_pico_ok(status["setDataBuffers"])
 
 
-overflow = ctypes.c_int16()
+overflow = np.zeros(nCaptures, dtype=np.int16)
 cmaxSamples = ctypes.c_int32(maxSamples)
 
 
-status["getValues"] = ps.ps4000aGetValues(
+status["getValuesBulk"] = ps.ps4000aGetValuesBulk(
    chandle,
-   0,  # startIndex
    ctypes.byref(cmaxSamples),
-   0,  # downSampleRatio
-   0,  # downSampleRatioMode
-   0,  # segmentIndex
-   ctypes.byref(overflow),
+   0,  # fromSegmentIndex
+   nCaptures - 1,  # toSegmentIndex
+   downSampleRatio,
+   ratioMode,
+   overflow.ctypes.data_as(ctypes.POINTER(ctypes.c_int16)),
 )
-assert_pico_ok(status["getValues"])
+assert_pico_ok(status["getValuesBulk"])
 
 
-# ------------------- 7. PLOT -------------------
-# Convert ADC values to mV
-adc_data = np.ctypeslib.as_array(buffer)
-# Max ADC value for PS4000A is usually 32767
-maxADC = ctypes.c_int16(32767)
+# ------------------- 7. CLEANUP -------------------
+# Release the scope before plotting: plt.show() blocks until the window is
+# closed, and the capture data already lives in our own buffer.
+status["stop"] = ps.ps4000aStop(chandle)
+status["close"] = ps.ps4000aCloseUnit(chandle)
+print("Device closed.")
 
 
-# Convert to mV using the range we set (Range 6 = 1000mV)
-data_mV = adc2mV(adc_data, chARange, maxADC)
+# ------------------- 8. PLOT -------------------
+# Convert ADC values to mV with mVPerCount, set from the configured chARange.
+# One vectorised multiply instead of adc2mV's per-sample Python loop.
+# The driver reports the values it wrote; never read past our own buffer.
+n = min(cmaxSamples.value, nOutSamples)
+adc_data = buffer[:, :, :n]
+data_mV = bufferMV[:, :, :n]
+np.multiply(adc_data, mVPerCount, out=data_mV, dtype=np.float32)
+# One trace per capture; aggregated data interleaves min/max pairs
+data_mV = data_mV.transpose(0, 2, 1).reshape(nCaptures, -1)
 
 
-# Create time axis
-time_ns = np.linspace(0, cmaxSamples.value * timeIntervalns.value, cmaxSamples.value)
-time_ms = time_ns / 1e6
+# Create time axis (sample index * sample interval), one entry per value
+time_ms = np.arange(n, dtype=np.float32) * np.float32(
+   timeIntervalns.value * downSampleRatio * 1e-6
+)
+time_ms = np.repeat(time_ms, nBuffers)
+
 
+# Long captures are reduced to per-bucket min/max pairs before plotting, the
+# way scope displays do, so drawing cost stays bounded by plotPoints.
+plotPoints = 4000
 
-plt.plot(time_ms, data_mV)
+
+def minMaxDecimate(t, y, targetPoints):
+   step = t.shape[0] // (targetPoints // 2)
+   if step < 2:
+      return t, y
+   nBuckets = t.shape[0] // step
+   yBuckets = y[..., : nBuckets * step].reshape(y.shape[:-1] + (nBuckets, step))
+   tBuckets = t[: nBuckets * step].reshape(nBuckets, step)
+   tOut = np.empty(2 * nBuckets, dtype=t.dtype)
+   tOut[0::2] = tBuckets[:, 0]
+   tOut[1::2] = tBuckets[:, -1]
+   yOut = np.empty(y.shape[:-1] + (2 * nBuckets,), dtype=y.dtype)
+   yOut[..., 0::2] = yBuckets.min(axis=-1)
+   yOut[..., 1::2] = yBuckets.max(axis=-1)
+   return tOut, yOut
+
+
+plotTime_ms, plotData_mV = minMaxDecimate(time_ms, data_mV, plotPoints)
+plt.plot(plotTime_ms, plotData_mV.T)
 plt.xlabel("Time (ms)")
 plt.ylabel("Voltage (mV)")
 plt.title("PicoScope 4000A Capture (1kHz Triangle)")
 plt.grid(True)
 plt.show()
-
-
-# ------------------- 8. CLEANUP -------------------
-status["stop"] = ps.ps4000aStop(chandle)
-status["close"] = ps.ps4000aCloseUnit(chandle)
-print("Device closed.")